@@ -192,8 +192,9 @@ class DataCommonsClient:
           filter_facet_ids=facets,
       )
 
-    # Convert the observations to a DataFrame
-    df = pd.DataFrame(observations.to_observation_records().model_dump())
+    # Convert the observations to a DataFrame (columnar form avoids building
+    # a record object per observation)
+    df = pd.DataFrame(observations.to_observation_columns())
 
     # Add entity names to the DataFrame
     df = add_entity_names_to_observations_dataframe(
@@ -1,3 +1,4 @@
+from concurrent.futures import as_completed
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from functools import wraps
@@ -6,7 +7,7 @@ import warnings
 
 from datacommons_client.endpoints.base import API
 from datacommons_client.endpoints.base import Endpoint
-from datacommons_client.endpoints.payloads import NodeRequestPayload
+from datacommons_client.endpoints.payloads import build_node_payload
 from datacommons_client.endpoints.payloads import normalize_list_to_string
 from datacommons_client.endpoints.response import NodeResponse
 from datacommons_client.models.node import Name
@@ -15,8 +16,9 @@ from datacommons_client.models.node import StatVarConstraint
 from datacommons_client.models.node import StatVarConstraints
 from datacommons_client.utils.graph import build_graph_map
 from datacommons_client.utils.graph import build_relationship_tree
-from datacommons_client.utils.graph import fetch_relationship_lru
+from datacommons_client.utils.graph import fetch_relationships_batch
 from datacommons_client.utils.graph import flatten_relationship
+from datacommons_client.utils.graph import RelationshipCache
 from datacommons_client.utils.names import DEFAULT_NAME_LANGUAGE
 from datacommons_client.utils.names import DEFAULT_NAME_PROPERTY
 from datacommons_client.utils.names import extract_name_from_english_name_property
@@ -27,6 +29,13 @@ PLACES_MAX_WORKERS = 10
 
 CONSTRAINT_PROPERTY: str = "constraintProperties"
 
+# Precomputed relation expressions for hot call paths. Passing these straight
+# to `fetch` skips the per-call normalization and f-string assembly done by
+# `fetch_property_values`.
+_EXPR_CONTAINED_IN_PLACE_OUT: str = "->containedInPlace"
+_EXPR_CONTAINED_IN_PLACE_IN: str = "<-containedInPlace"
+_EXPR_ALL_CLASSES: str = "<-typeOf"
+
 _DEPRECATED_METHODS: dict[str, dict[str, str | dict[str, str]]] = {
     "fetch_entity_parents": {
         "new_name": "fetch_place_parents",
@@ -55,6 +64,11 @@ class NodeEndpoint(Endpoint):
     """Initializes the NodeEndpoint with a given API configuration."""
     super().__init__(endpoint="node", api=api)
 
+    # Cache of resolved names, keyed by (dcid, language, fallback_language).
+    # Typical workflows call fetch_entity_names repeatedly with overlapping
+    # DCID sets; cached entries avoid refetching names already resolved.
+    self._name_cache: dict[tuple[str, Optional[str], Optional[str]], Name] = {}
+
   def __getattr__(self, name):
     if name in _DEPRECATED_METHODS:
       method_info = _DEPRECATED_METHODS[name]
@@ -118,8 +132,7 @@ class NodeEndpoint(Endpoint):
         """
 
     # Create the payload
-    payload = NodeRequestPayload(node_dcids=node_dcids,
-                                 expression=expression).to_dict()
+    payload = build_node_payload(node_dcids=node_dcids, expression=expression)
 
     # Make the request and return the response.
     return NodeResponse.model_validate(
@@ -244,10 +257,9 @@ class NodeEndpoint(Endpoint):
             ```
         """
 
-    return self.fetch_property_values(
+    return self.fetch(
         node_dcids="Class",
-        properties="typeOf",
-        out=False,
+        expression=_EXPR_ALL_CLASSES,
         all_pages=all_pages,
         next_token=next_token,
     )
@@ -270,19 +282,31 @@ class NodeEndpoint(Endpoint):
             the property used.
         """
 
-    # Check if entity_dcids is a single string. If so, convert it to a list.
-    if isinstance(entity_dcids, str):
-      entity_dcids = [entity_dcids]
+    # Normalize to a list and drop duplicate DCIDs, preserving order.
+    entity_dcids = list(
+        dict.fromkeys(
+            [entity_dcids] if isinstance(entity_dcids, str) else entity_dcids))
 
     # If langauge is English, use the more efficient 'name' property.
     name_property = (DEFAULT_NAME_PROPERTY if language == DEFAULT_NAME_LANGUAGE
                      else NAME_WITH_LANGUAGE_PROPERTY)
 
-    # Fetch names the given entity DCIDs.
-    data = self.fetch_property_values(
-        node_dcids=entity_dcids, properties=name_property).get_properties()
-
+    # Partition the input into already-cached names and DCIDs still to fetch.
     names: dict[str, Name] = {}
+    missing_dcids: list[str] = []
+    for dcid in entity_dcids:
+      cached_name = self._name_cache.get((dcid, language, fallback_language))
+      if cached_name is not None:
+        names[dcid] = cached_name
+      else:
+        missing_dcids.append(dcid)
+
+    if not missing_dcids:
+      return names
+
+    # Fetch names for the missing entity DCIDs only.
+    data = self.fetch_property_values(
+        node_dcids=missing_dcids, properties=name_property).get_properties()
 
     # Iterate through the fetched data and populate the names dictionary.
     for dcid, properties in data.items():
@@ -304,6 +328,7 @@ class NodeEndpoint(Endpoint):
             language=lang_used,
             property=name_property,
         )
+        self._name_cache[(dcid, language, fallback_language)] = names[dcid]
 
     return names
 
@@ -334,13 +359,21 @@ class NodeEndpoint(Endpoint):
     if out and contained_type:
       raise ValueError("When 'out' is True, `contained_type' must be None.")
 
-    prop = "containedInPlace+" if contained_type else "containedInPlace"
+    # Drop duplicate DCIDs (preserving order) to keep the request payload small.
+    if not isinstance(node_dcids, str):
+      node_dcids = list(dict.fromkeys(node_dcids))
 
-    data = self.fetch_property_values(
+    if contained_type:
+      prop = "containedInPlace+"
+      expression = f"<-{prop}{{typeOf:{contained_type}}}"
+    else:
+      prop = "containedInPlace"
+      expression = (_EXPR_CONTAINED_IN_PLACE_OUT
+                    if out else _EXPR_CONTAINED_IN_PLACE_IN)
+
+    data = self.fetch(
         node_dcids=node_dcids,
-        properties=prop,
-        out=out,
-        constraints=f"typeOf:{contained_type}" if contained_type else None,
+        expression=expression,
     ).get_properties()
 
     result = {}
@@ -433,17 +466,24 @@ class NodeEndpoint(Endpoint):
                 - A nested tree (if `as_tree` is True).
         """
 
-    if isinstance(place_dcids, str):
-      place_dcids = [place_dcids]
+    # Normalize to a list and drop duplicate DCIDs, preserving order.
+    place_dcids = list(
+        dict.fromkeys(
+            [place_dcids] if isinstance(place_dcids, str) else place_dcids))
 
     result = {}
 
+    # Shared across roots so relationships common to several roots are fetched
+    # once, even by concurrently-traversing threads.
+    relationship_cache = RelationshipCache()
+
     # Create a partial function to fetch relationships with the current parameters
     fetch_fn = partial(
-        fetch_relationship_lru,
+        fetch_relationships_batch,
         self,
         contained_type=contained_type,
         relationship=relationship,
+        cache=relationship_cache,
     )
 
     # Use a thread pool to fetch ancestry graphs in parallel for each input entity
@@ -452,8 +492,9 @@ class NodeEndpoint(Endpoint):
           executor.submit(build_graph_map, root=dcid, fetch_fn=fetch_fn)
           for dcid in place_dcids
       ]
-      # Gather ancestry maps and postprocess into flat or nested form
-      for future in futures:
+      # Gather ancestry maps as they complete, so postprocessing overlaps
+      # with fetches still in flight for other roots
+      for future in as_completed(futures):
         dcid, ancestry = future.result()
         if as_tree:
           ancestry = build_relationship_tree(root=dcid,
@@ -560,14 +601,15 @@ class NodeEndpoint(Endpoint):
     result: dict[str, dict[str, list[dict]]] = {}
 
     for node, props in data.items():
-      result.setdefault(node, {})
-      for prop, metadata in props.items():
-        dest = result[node].setdefault(prop, [])
-        for n in metadata:
-          # Prefer 'dcid', but if property is terminal, fall back to 'value'.
-          dcid = n.dcid or n.value
-          name = n.name or n.value
-          dest.append({"dcid": dcid, "name": name})
+      result[node] = {
+          prop: [
+              # Prefer 'dcid', but if property is terminal, fall back to 'value'.
+              {
+                  "dcid": n.dcid or n.value,
+                  "name": n.name or n.value
+              } for n in metadata
+          ] for prop, metadata in props.items()
+      }
     return result
 
   def fetch_statvar_constraints(
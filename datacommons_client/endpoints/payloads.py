@@ -1,4 +1,5 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from pydantic import Field
 from pydantic import field_serializer
@@ -10,7 +11,7 @@ from datacommons_client.models.base import BaseDCModel
 from datacommons_client.models.base import ListOrStr
 from datacommons_client.models.observation import ObservationDate
 from datacommons_client.models.observation import ObservationSelect
-from datacommons_client.models.observation import ObservationSelectList
+from datacommons_client.models.observation import validate_select
 
 
 def normalize_list_to_string(value: str | list[str]) -> str:
@@ -35,6 +36,34 @@ class NodeRequestPayload(BaseDCModel):
   expression: list | str = Field(..., serialization_alias="property")
 
 
+@lru_cache(maxsize=128)
+def _node_payload_dict(node_dcids: str | tuple[str, ...],
+                       expression: str) -> dict[str, Any]:
+  """Builds (and caches) the serialized payload for a Node request."""
+  dcids = list(node_dcids) if isinstance(node_dcids, tuple) else node_dcids
+  return NodeRequestPayload(node_dcids=dcids, expression=expression).to_dict()
+
+
+def build_node_payload(node_dcids: str | list[str],
+                       expression: str) -> dict[str, Any]:
+  """Returns the serialized payload for a Node request.
+
+    Identical payloads (same DCIDs and expression) are serialized once and
+    reused, which avoids re-validating the model on repeated paginated calls.
+
+    Args:
+        node_dcids (str | list[str]): The DCID(s) of the nodes to query.
+        expression (str): The property or relation expression(s) to query.
+
+    Returns:
+        dict[str, Any]: The payload dictionary for the request.
+    """
+  key = tuple(node_dcids) if isinstance(node_dcids, list) else node_dcids
+
+  # Copy so callers (e.g. pagination) can safely mutate the payload.
+  return dict(_node_payload_dict(key, expression))
+
+
 class ObservationRequestPayload(BaseDCModel):
   """
     A Pydantic model to structure, normalize, and validate the payload for an Observation V2 API request.
@@ -54,7 +83,7 @@ class ObservationRequestPayload(BaseDCModel):
                                       validate_default=True)
   variable_dcids: Optional[ListOrStr] = Field(default=None,
                                               serialization_alias="variable")
-  select: Optional[list[str]] = None
+  select: Optional[list[str]] = Field(default=None, validate_default=True)
   entity_dcids: Optional[ListOrStr] = None
   entity_expression: Optional[str | list[str]] = None
   filter_facet_domains: Optional[ListOrStr] = None
@@ -69,7 +98,9 @@ class ObservationRequestPayload(BaseDCModel):
 
   @field_validator("select", mode="before")
   def _coerce_select(cls, v):
-    return ObservationSelectList.model_validate(v).select
+    # Calls the plain function rather than round-tripping the list through
+    # the ObservationSelectList model.
+    return validate_select(v)
 
   @field_validator("entity_expression", mode="before")
   def _coerce_expr(cls, v):
@@ -4,10 +4,12 @@ from pydantic import Field
 from pydantic import field_validator
 
 from datacommons_client.models.base import BaseDCModel
+from datacommons_client.models.base import entityDCID
 from datacommons_client.models.base import facetID
 from datacommons_client.models.base import NextToken
 from datacommons_client.models.base import NodeDCID
 from datacommons_client.models.base import Property
+from datacommons_client.models.base import variableDCID
 from datacommons_client.models.node import Arcs
 from datacommons_client.models.node import FlattenedPropertiesMapping
 from datacommons_client.models.node import NodeDCIDList
@@ -16,10 +18,12 @@ from datacommons_client.models.node import Properties
 from datacommons_client.models.observation import ByVariable
 from datacommons_client.models.observation import Facet
 from datacommons_client.models.observation import ObservationRecords
+from datacommons_client.models.observation import OrderedFacets
 from datacommons_client.models.observation import VariableByEntity
 from datacommons_client.models.resolve import Entity
 from datacommons_client.models.resolve import FlatCandidateMapping
 from datacommons_client.utils.data_processing import flatten_properties
+from datacommons_client.utils.data_processing import observations_as_columns
 from datacommons_client.utils.data_processing import observations_as_records
 
 
@@ -130,17 +134,26 @@ class ObservationResponse(BaseDCModel):
   byVariable: ByVariable = Field(default_factory=ByVariable)
   facets: Dict[facetID, Facet] = Field(default_factory=dict)
 
+  def _data_by_entity(
+      self) -> Dict[variableDCID, Dict[entityDCID, OrderedFacets]]:
+    """Returns the per-variable entity data as a plain mapping.
+
+        Internal hot paths iterate this directly, skipping the root-model
+        wrapper that `get_data_by_entity` builds for the public API.
+        """
+    return {
+        var_dcid: var_model.byEntity
+        for var_dcid, var_model in self.byVariable.items()
+    }
+
   def get_data_by_entity(self) -> VariableByEntity:
     """Unpacks the data for each entity, for each variable.
 
         Returns:
             Dict: The variables object from the response.
         """
-    raw_payload = {
-        var_dcid: var_model.byEntity
-        for var_dcid, var_model in self.byVariable.items()
-    }
-    return VariableByEntity.model_validate(raw_payload)
+    # The nested models are already validated, so skip re-running validators.
+    return VariableByEntity.model_construct(root=self._data_by_entity())
 
   def to_observation_records(self) -> ObservationRecords:
     """Returns a flat list of observation records combining date, variable, entity,
@@ -157,7 +170,21 @@ class ObservationResponse(BaseDCModel):
         ObservationRecord: A list of observation records, where each record contains the variable,
         entity, date, value, facetId, and any additional metadata provided by the facet.
         """
-    return observations_as_records(data=self.get_data_by_entity(),
+    return observations_as_records(data=self._data_by_entity(),
+                                   facets=self.facets)
+
+  def to_observation_columns(self) -> dict[str, list]:
+    """Returns the observations in columnar form, one list per record field.
+
+    This produces the same fields as `to_observation_records` but laid out as
+    columns, which is the layout DataFrame constructors consume directly and
+    avoids building a record object per observation.
+
+    Returns:
+        dict[str, list]: A mapping of column name (date, variable, entity,
+        value, facetId, and facet metadata fields) to column values.
+        """
+    return observations_as_columns(data=self._data_by_entity(),
                                    facets=self.facets)
 
   def get_facets_metadata(self) -> Dict[str, dict]:
@@ -174,24 +201,23 @@ class ObservationResponse(BaseDCModel):
     metadata = {}
 
     # Extract information from byVariable
-    data_by_entity = self.get_data_by_entity()
+    data_by_entity = self._data_by_entity()
 
     # Extract facet information
     facets_info = self.facets
 
     for dcid, variables in data_by_entity.items():
-      metadata[dcid] = {}
+      variable_metadata = metadata[dcid] = {}
 
       for entity_id, entity in variables.items():
         for facet in entity.orderedFacets:
-          facet_metadata = metadata[dcid].setdefault(
-              facet.facetId,
-              {
-                  "earliestDate": {},
-                  "latestDate": {},
-                  "obsCount": {},
-              },
-          )
+          facet_metadata = variable_metadata.get(facet.facetId)
+          if facet_metadata is None:
+            facet_metadata = variable_metadata[facet.facetId] = {
+                "earliestDate": {},
+                "latestDate": {},
+                "obsCount": {},
+            }
 
           facet_metadata["earliestDate"][entity_id] = facet.earliestDate
           facet_metadata["latestDate"][entity_id] = facet.latestDate
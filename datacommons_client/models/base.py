@@ -7,6 +7,11 @@ from pydantic import BeforeValidator
 from pydantic import ConfigDict
 from pydantic import RootModel
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
 
 def listify(v: Any) -> list[str]:
   if isinstance(v, (str, bytes)):
@@ -32,11 +37,17 @@ DominantType: TypeAlias = str
 class BaseDCModel(BaseModel):
   """Provides serialization methods for the Pydantic models used by the client."""
 
+  # Defaults are literal (None/empty) values, so re-validating them on every
+  # instantiation is wasted work; fields whose default genuinely needs
+  # validation opt in with Field(..., validate_default=True).
+  # The models are read-only records of API responses: frozen=True lets
+  # pydantic-core skip the assignment guard rails (and makes them hashable).
   model_config = ConfigDict(validate_by_name=True,
-                            validate_default=True,
+                            validate_default=False,
                             validate_by_alias=True,
                             use_enum_values=True,
-                            serialize_by_alias=True)
+                            serialize_by_alias=True,
+                            frozen=True)
 
   def __str__(self) -> str:
     """Returns a string representation of the instance."""
@@ -63,6 +74,11 @@ class BaseDCModel(BaseModel):
         Returns:
             str: The JSON string representation of the instance.
         """
+    if orjson is not None:
+      return orjson.dumps(self.model_dump(mode="json",
+                                          exclude_none=exclude_none),
+                          option=orjson.OPT_INDENT_2).decode()
+
     return self.model_dump_json(exclude_none=exclude_none, indent=2)
 
 
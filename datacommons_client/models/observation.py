@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import List, Optional
+import sys
+from typing import Optional
 
 from pydantic import Field
 from pydantic import field_validator
@@ -22,15 +23,22 @@ class ObservationDate(str, Enum):
   @classmethod
   def _missing_(cls, value):
     if isinstance(value, str):
-      u = value.strip().upper()
-      if u == "LATEST":
-        return cls.LATEST
-      if u in ("ALL", ""):
-        return cls.ALL
+      member = _OBSERVATION_DATE_ALIASES.get(value.strip().upper())
+      if member is not None:
+        return member
     raise ValueError(f"Invalid date value: '{value}'. Only 'LATEST' or"
                      f" '' (empty string) are allowed.")
 
 
+# Normalized aliases accepted for ObservationDate, resolved with a single
+# dict probe instead of chained string comparisons.
+_OBSERVATION_DATE_ALIASES = {
+    "LATEST": ObservationDate.LATEST,
+    "ALL": ObservationDate.ALL,
+    "": ObservationDate.ALL,
+}
+
+
 class ObservationSelect(str, Enum):
   DATE = "date"
   VARIABLE = "variable"
@@ -40,48 +48,89 @@ class ObservationSelect(str, Enum):
 
   @classmethod
   def valid_values(cls):
-    """Returns a list of valid enum values."""
-    return sorted(cls._value2member_map_.keys())
+    """Returns the sorted tuple of valid enum values."""
+    return _SORTED_SELECT_VALUES
 
   @classmethod
   def _missing_(cls, value):
     """Handle missing enum values by raising a custom error."""
-    message = f"Invalid `select` Field: '{value}'. Only {', '.join(cls.valid_values())} are allowed."
+    message = (f"Invalid `select` Field: '{value}'."
+               f" Only {_SELECT_VALUES_MESSAGE} are allowed.")
     raise InvalidObservationSelectError(message=message)
 
 
-class ObservationSelectList(RootModel[list[ObservationSelect]]):
-  """A model to represent a list of ObservationSelect values.
+# Valid select values, precomputed once at import so the hot validation path
+# does a single frozenset membership probe instead of Enum construction per
+# element, and the error path skips re-sorting and re-joining the member map.
+_VALID_SELECT_VALUES = frozenset(v.value for v in ObservationSelect)
+_SORTED_SELECT_VALUES = tuple(sorted(_VALID_SELECT_VALUES))
+_SELECT_VALUES_MESSAGE = ", ".join(_SORTED_SELECT_VALUES)
 
-    Attributes:
-        select (List[ObservationSelect]): A list of ObservationSelect enum values.
+# Select values every request must include.
+_REQUIRED_SELECT_VALUES = frozenset(
+    {ObservationSelect.VARIABLE.value, ObservationSelect.ENTITY.value})
+
+# Select values applied when a request does not specify any.
+_DEFAULT_SELECT_VALUES = (
+    ObservationSelect.DATE.value,
+    ObservationSelect.VARIABLE.value,
+    ObservationSelect.ENTITY.value,
+    ObservationSelect.VALUE.value,
+)
+
+
+def validate_select(v: Optional[list[ObservationSelect | str]]) -> list[str]:
+  """Validates and coerces select values to a plain list of strings.
+
+    This is the validation behind ObservationSelectList, exposed as a plain
+    function so hot request paths can call it without constructing a pydantic
+    model around the list.
+
+    Args:
+        v: A list of ObservationSelect values or strings, or None for the
+          default selection.
+    Returns:
+        The validated select values as a list of strings.
     """
+  values = _DEFAULT_SELECT_VALUES if v is None else v
 
-  root: Optional[list[ObservationSelect | str]] = None
+  # Single pass: valid strings pass straight through (anything else goes
+  # through the Enum constructor, which raises for invalid values), while
+  # the seen set is tracked for the required-fields check below.
+  select: list[str] = []
+  seen: set[str] = set()
+  for s in values:
+    value = (s if isinstance(s, str) and s in _VALID_SELECT_VALUES else
+             ObservationSelect(s).value)
+    select.append(value)
+    seen.add(value)
 
-  @field_validator("root", mode="before")
-  def _validate_select(cls, v):
-    if v is None:
-      select = [
-          ObservationSelect.DATE,
-          ObservationSelect.VARIABLE,
-          ObservationSelect.ENTITY,
-          ObservationSelect.VALUE,
-      ]
-    else:
-      select = v
+  missing_fields = _REQUIRED_SELECT_VALUES - seen
+  if missing_fields:
+    raise InvalidObservationSelectError(message=(
+        f"The 'select' field must include at least the following: {', '.join(_REQUIRED_SELECT_VALUES)} "
+        f"(missing: {', '.join(missing_fields)})"))
 
-    select = [ObservationSelect(s).value for s in select]
+  return select
 
-    required_select = {"variable", "entity"}
 
-    missing_fields = required_select - set(select)
-    if missing_fields:
-      raise InvalidObservationSelectError(message=(
-          f"The 'select' field must include at least the following: {', '.join(required_select)} "
-          f"(missing: {', '.join(missing_fields)})"))
+class ObservationSelectList(RootModel[list[str]]):
+  """A model to represent a list of ObservationSelect values.
 
-    return select
+    The root is annotated as plain strings: the before-validator already
+    coerces every entry to a valid select value, so annotating the root with
+    the Enum would only re-run enum lookup per element. `ObservationSelect`
+    remains the public namespace for the valid values.
+
+    Attributes:
+        select (List[str]): A list of ObservationSelect string values.
+    """
+
+  root: Optional[list[str]] = None
+
+  @field_validator("root", mode="before")
+  def _validate_select(cls, v):
+    return validate_select(v)
 
   @property
   def select(self) -> list[str]:
@@ -118,6 +167,22 @@ class OrderedFacet(BaseDCModel):
   obsCount: Optional[int] = None
   observations: list[Observation] = Field(default_factory=list)
 
+  # A response repeats the same few facet IDs across many entities; interning
+  # collapses the duplicate strings into one object apiece.
+  @field_validator("facetId", mode="after")
+  def _intern_strings(cls, v):
+    return sys.intern(v) if isinstance(v, str) else v
+
+  @property
+  def dates(self) -> list[Optional[str]]:
+    """Returns the observation dates as a single column."""
+    return [observation.date for observation in self.observations]
+
+  @property
+  def values(self) -> list[Optional[float]]:
+    """Returns the observation values as a single column."""
+    return [observation.value for observation in self.observations]
+
 
 class OrderedFacets(BaseDCModel):
   """Represents a list of ordered facets.
@@ -153,6 +218,18 @@ class Facet(BaseDCModel):
   provenanceUrl: Optional[str] = None
   unit: Optional[str] = None
 
+  # Facet metadata takes the same few distinct values across a response;
+  # interning makes duplicates share a single string object and turns later
+  # equality checks into pointer comparisons.
+  @field_validator("importName",
+                   "measurementMethod",
+                   "observationPeriod",
+                   "provenanceUrl",
+                   "unit",
+                   mode="after")
+  def _intern_strings(cls, v):
+    return sys.intern(v) if isinstance(v, str) else v
+
 
 class ByVariable(BaseDCModel, DictLikeRootModel[dict[variableDCID, Variable]]):
   """A root model whose value is a dict mapping variableDCID to Variable."""
@@ -1,3 +1,4 @@
+from unittest.mock import ANY
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -9,6 +10,7 @@ from datacommons_client.models.node import Name
 from datacommons_client.models.node import Node
 from datacommons_client.models.node import NodeGroup
 from datacommons_client.models.node import StatVarConstraints
+from datacommons_client.utils.graph import RelationshipCache
 from datacommons_client.utils.names import DEFAULT_NAME_PROPERTY
 from datacommons_client.utils.names import NAME_WITH_LANGUAGE_PROPERTY
 
@@ -111,16 +113,15 @@ def test_node_endpoint_fetch_all_classes():
   """Test fetch_all_classes method."""
   api_mock = MagicMock(spec=API)
   endpoint = NodeEndpoint(api=api_mock)
-  endpoint.fetch_property_values = MagicMock(return_value=NodeResponse(
+  endpoint.fetch = MagicMock(return_value=NodeResponse(
       data={"Class": {
           "arcs": {}
       }}))
 
   response = endpoint.fetch_all_classes()
-  endpoint.fetch_property_values.assert_called_once_with(
+  endpoint.fetch.assert_called_once_with(
       node_dcids="Class",
-      properties="typeOf",
-      out=False,
+      expression="<-typeOf",
       all_pages=True,
       next_token=None,
   )
@@ -290,19 +291,45 @@ def test_fetch_entity_names_no_result(mock_extract_name_lang):
   assert result == {}
 
 
+@patch(
+    "datacommons_client.endpoints.node.extract_name_from_english_name_property")
+def test_fetch_entity_names_uses_cache(mock_extract_name):
+  """Test that already-resolved names are served from the cache."""
+  mock_extract_name.return_value = "Guatemala"
+  api_mock = MagicMock(spec=API)
+  endpoint = NodeEndpoint(api=api_mock)
+
+  endpoint.fetch_property_values = MagicMock(return_value=NodeResponse(
+      data={
+          "dc/123":
+              Arcs(arcs={"name": NodeGroup(nodes=[Node(value="Guatemala")])})
+      }))
+
+  first = endpoint.fetch_entity_names("dc/123")
+  second = endpoint.fetch_entity_names("dc/123")
+
+  assert first == second
+  # The second call is served entirely from the cache.
+  endpoint.fetch_property_values.assert_called_once_with(
+      node_dcids=["dc/123"], properties=DEFAULT_NAME_PROPERTY)
+
+
 @patch("datacommons_client.endpoints.node.flatten_relationship")
 @patch("datacommons_client.endpoints.node.build_graph_map")
-@patch("datacommons_client.endpoints.node.fetch_relationship_lru")
-def test_fetch_entity_relationships_delegates_to_lru(mock_lru, mock_build_map,
-                                                     mock_flatten):
+@patch("datacommons_client.endpoints.node.fetch_relationships_batch")
+def test_fetch_entity_relationships_delegates_to_batch(mock_batch,
+                                                       mock_build_map,
+                                                       mock_flatten):
   """Ensure that the private helper builds a fetch‑function that ultimately
-    calls through to ``fetch_relationship_lru`` for each root DCID."""
+    calls through to ``fetch_relationships_batch`` with a shared cache."""
 
-  mock_lru.return_value = [Node(dcid="B", name="B name", types=["Region"])]
+  mock_batch.return_value = {
+      "X": [Node(dcid="B", name="B name", types=["Region"])]
+  }
 
   def _fake_build_graph_map(root, fetch_fn):
     # simulate the internal traversal by invoking the provided fetch_fn once
-    fetch_fn(dcid=root)
+    fetch_fn(dcids=[root])
     return root, {}
 
   mock_build_map.side_effect = _fake_build_graph_map
@@ -315,12 +342,14 @@ def test_fetch_entity_relationships_delegates_to_lru(mock_lru, mock_build_map,
                                                relationship="parents")
 
   assert result == {"X": []}
-  mock_lru.assert_called_once_with(
+  mock_batch.assert_called_once_with(
       endpoint,
-      dcid="X",
+      dcids=["X"],
       contained_type="Region",
       relationship="parents",
+      cache=ANY,
   )
+  assert isinstance(mock_batch.call_args.kwargs["cache"], RelationshipCache)
 
 
 @patch("datacommons_client.endpoints.node.flatten_relationship")
@@ -1,5 +1,6 @@
 import pytest
 
+from datacommons_client.endpoints.payloads import build_node_payload
 from datacommons_client.endpoints.payloads import NodeRequestPayload
 from datacommons_client.endpoints.payloads import ObservationRequestPayload
 from datacommons_client.endpoints.payloads import ResolveRequestPayload
@@ -31,6 +32,21 @@ def test_node_payload_to_dict():
   assert payload.to_dict() == {"nodes": ["node1"], "property": "prop1"}
 
 
+def test_build_node_payload_returns_fresh_copies():
+  """Tests that build_node_payload caches per (dcids, expression) and returns
+    independent dictionaries."""
+  first = build_node_payload(node_dcids=["node1"], expression="prop1")
+  second = build_node_payload(node_dcids=["node1"], expression="prop1")
+
+  assert first == {"nodes": ["node1"], "property": "prop1"}
+  assert first == second
+
+  # Mutating one copy (as pagination does) must not leak into the next call.
+  first["nextToken"] = "token"
+  assert "nextToken" not in build_node_payload(node_dcids=["node1"],
+                                               expression="prop1")
+
+
 def test_observation_payload_normalize():
   """Tests that ObservationRequestPayload normalizes inputs correctly."""
   payload = ObservationRequestPayload(
@@ -64,6 +80,17 @@ def test_observation_payload_normalize():
   assert "filter" not in payload.to_dict()
 
 
+def test_observation_payload_default_select():
+  """Tests that an omitted select still serializes to the default list."""
+  payload = ObservationRequestPayload(
+      date="LATEST",
+      variable_dcids="var1",
+      entity_dcids="ent1",
+  )
+  assert payload.select == ["date", "variable", "entity", "value"]
+  assert payload.to_dict()["select"] == ["date", "variable", "entity", "value"]
+
+
 def test_observation_select_invalid_value():
   """Tests that an invalid ObservationSelect value raises InvalidObservationSelectError."""
   with pytest.raises(InvalidObservationSelectError):
@@ -790,6 +790,47 @@ def test_get_observations_as_records():
   assert result.model_dump(exclude_none=True) == expected
 
 
+def test_to_observation_columns():
+  """Test that to_observation_columns returns the records in columnar form."""
+  mock_data = ByVariable.model_validate({
+      "variable1":
+          Variable(
+              byEntity={
+                  "entity1": {
+                      "orderedFacets": [
+                          OrderedFacet(
+                              facetId="facet1",
+                              observations=[
+                                  Observation(date="2023-01-01", value=10.0),
+                                  Observation(date="2023-01-15", value=15.0),
+                              ],
+                          )
+                      ]
+                  }
+              })
+  })
+
+  mock_facets = {"facet1": Facet(importName="ImportName")}
+
+  response = ObservationResponse(byVariable=mock_data, facets=mock_facets)
+
+  result = response.to_observation_columns()
+
+  # Every record column is present, with None for unset metadata (e.g. unit)
+  assert result == {
+      "date": ["2023-01-01", "2023-01-15"],
+      "entity": ["entity1", "entity1"],
+      "variable": ["variable1", "variable1"],
+      "facetId": ["facet1", "facet1"],
+      "importName": ["ImportName", "ImportName"],
+      "measurementMethod": [None, None],
+      "observationPeriod": [None, None],
+      "provenanceUrl": [None, None],
+      "unit": [None, None],
+      "value": [10.0, 15.0],
+  }
+
+
 ### ----- Test Resolve Response ----- ###
 
 
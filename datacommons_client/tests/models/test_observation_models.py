@@ -56,6 +56,16 @@ def test_ordered_facets_model_validation():
   assert ordered_facets.observations[0].value == 100.0
 
 
+def test_ordered_facets_columnar_properties():
+  """Test that OrderedFacet exposes dates and values as columns."""
+  ordered_facets = OrderedFacet(observations=[
+      Observation(date="2023-01-01", value=100.0),
+      Observation(date="2024-01-01", value=200.0),
+  ])
+  assert ordered_facets.dates == ["2023-01-01", "2024-01-01"]
+  assert ordered_facets.values == [100.0, 200.0]
+
+
 def test_ordered_facets_model_validation_empty_observations():
   """Test OrderedFacet.model_validate with empty observations."""
   json_data = {
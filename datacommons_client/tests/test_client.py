@@ -136,8 +136,8 @@ def test_observations_dataframe_raises_error_when_invalid_entity_type_usage(
 def test_observations_dataframe_calls_fetch_observations_by_entity_type(
     mock_client):
   """Tests that fetch_observations_by_entity_type is called with correct parameters."""
-  mock_client.observation.fetch_observations_by_entity_type.return_value.to_observation_records.return_value = (
-      ObservationRecords.model_validate([]))
+  mock_client.observation.fetch_observations_by_entity_type.return_value.to_observation_columns.return_value = (
+      {})
 
   df = mock_client.observations_dataframe(
       variable_dcids=["var1", "var2"],
@@ -162,8 +162,8 @@ def test_observations_dataframe_calls_fetch_observations_by_entity_type(
 def test_observations_dataframe_calls_fetch_observations_by_entity(mock_client):
   """Tests that fetch_observations_by_entity is called with correct parameters."""
 
-  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_records.return_value = (
-      ObservationRecords([]))
+  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_columns.return_value = (
+      {})
 
   df = mock_client.observations_dataframe(variable_dcids="var1",
                                           date="latest",
@@ -183,23 +183,13 @@ def test_observations_dataframe_calls_fetch_observations_by_entity(mock_client):
 def test_observations_dataframe_returns_dataframe_with_expected_columns(
     mock_client):
   """Tests that the method returns a DataFrame with expected columns."""
-  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_records.return_value = ObservationRecords.model_validate(
-      [
-          {
-              "date": "2024",
-              "entity": "entity1",
-              "variable": "var1",
-              "value": 100,
-              "unit": "unit1",
-          },
-          {
-              "date": "2024",
-              "entity": "entity2",
-              "variable": "var2",
-              "value": 200,
-              "unit": "unit2",
-          },
-      ])
+  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_columns.return_value = {
+      "date": ["2024", "2024"],
+      "entity": ["entity1", "entity2"],
+      "variable": ["var1", "var2"],
+      "unit": ["unit1", "unit2"],
+      "value": [100, 200],
+  }
 
   # Mock entity name lookup to prevent API calls
   mock_client.node.fetch_entity_names = MagicMock(return_value={
@@ -236,23 +226,13 @@ def test_observations_dataframe_returns_dataframe_with_expected_columns(
 def test_observations_dataframe_includes_constraints_metadata(mock_client):
   """When include_constraints_metadata=True, DataFrame includes constraint columns."""
   # Two observations with different variables
-  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_records.return_value = ObservationRecords.model_validate(
-      [
-          {
-              "date": "2021",
-              "entity": "geo/1",
-              "variable": "sv/A",
-              "value": 1,
-              "unit": "Count",
-          },
-          {
-              "date": "2021",
-              "entity": "geo/2",
-              "variable": "sv/B",
-              "value": 2,
-              "unit": "Count",
-          },
-      ])
+  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_columns.return_value = {
+      "date": ["2021", "2021"],
+      "entity": ["geo/1", "geo/2"],
+      "variable": ["sv/A", "sv/B"],
+      "unit": ["Count", "Count"],
+      "value": [1, 2],
+  }
 
   # Avoid name lookups
   mock_client.node.fetch_entity_names = MagicMock(return_value={})
@@ -345,8 +325,8 @@ def test_observations_dataframe_filters_by_facet_ids(mock_client):
   mock_client._find_filter_facet_ids = MagicMock(
       return_value=["facet_1", "facet_2"])
 
-  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_records.return_value = (
-      ObservationRecords.model_validate([]))
+  mock_client.observation.fetch_observations_by_entity_dcid.return_value.to_observation_columns.return_value = (
+      {})
 
   df = mock_client.observations_dataframe(
       variable_dcids="var1",
@@ -1,72 +1,120 @@
 from collections import defaultdict
 from unittest.mock import MagicMock
 
+import pytest
+
 from datacommons_client.models.node import Node
 from datacommons_client.utils.graph import _assemble_tree
-from datacommons_client.utils.graph import _fetch_relationship_uncached
+from datacommons_client.utils.graph import _fetch_relationships_uncached
 from datacommons_client.utils.graph import _postorder_nodes
 from datacommons_client.utils.graph import build_graph_map
 from datacommons_client.utils.graph import build_relationship_tree
-from datacommons_client.utils.graph import fetch_relationship_lru
+from datacommons_client.utils.graph import fetch_relationships_batch
 from datacommons_client.utils.graph import flatten_relationship
+from datacommons_client.utils.graph import RelationshipCache
 
 
-def test_fetch_parents_uncached_returns_data():
-  """Test _fetch_parents_uncached delegates to endpoint correctly."""
+def test_fetch_relationships_uncached_returns_data():
+  """Test _fetch_relationships_uncached delegates to endpoint correctly."""
   endpoint = MagicMock()
-  endpoint.fetch_place_parents.return_value.get.return_value = [
-      Node(dcid="parent1", name="Parent 1", types=["Country"])
-  ]
-
-  result = _fetch_relationship_uncached(endpoint,
-                                        "test_dcid",
-                                        contained_type=None,
-                                        relationship="parents")
-  assert isinstance(result, list)
-  assert result[0].dcid == "parent1"
+  endpoint.fetch_place_parents.return_value = {
+      "test_dcid": [Node(dcid="parent1", name="Parent 1", types=["Country"])]
+  }
+
+  result = _fetch_relationships_uncached(endpoint, ["test_dcid"],
+                                         contained_type=None,
+                                         relationship="parents")
+  assert isinstance(result, dict)
+  assert result["test_dcid"][0].dcid == "parent1"
   endpoint.fetch_place_parents.assert_called_once_with(
-      "test_dcid",
+      ["test_dcid"],
       as_dict=False,
   )
 
 
-def test_fetch_relationship_lru_caches_results():
-  """Test fetch_relationship_lru uses LRU cache and returns list."""
+def test_fetch_relationships_batch_uses_shared_cache():
+  """Test fetch_relationships_batch only fetches DCIDs missing from the cache."""
   endpoint = MagicMock()
-  endpoint.fetch_place_parents.return_value.get.return_value = [
-      Node(dcid="parentX", name="Parent X", types=["Region"])
-  ]
-
-  result1 = fetch_relationship_lru(endpoint,
-                                   "nodeA",
-                                   contained_type=None,
-                                   relationship="parents")
-  result2 = fetch_relationship_lru(endpoint,
-                                   "nodeA",
-                                   contained_type=None,
-                                   relationship="parents")
-  fetch_relationship_lru(endpoint,
-                         "nodeA",
-                         contained_type=None,
-                         relationship="parents")
-
-  assert isinstance(result1, list)
-  assert result1[0].dcid == "parentX"
+  endpoint.fetch_place_parents.return_value = {
+      "nodeA": [Node(dcid="parentX", name="Parent X", types=["Region"])]
+  }
+
+  cache = RelationshipCache()
+  result1 = fetch_relationships_batch(endpoint, ["nodeA"],
+                                      contained_type=None,
+                                      relationship="parents",
+                                      cache=cache)
+  result2 = fetch_relationships_batch(endpoint, ["nodeA"],
+                                      contained_type=None,
+                                      relationship="parents",
+                                      cache=cache)
+
+  assert isinstance(result1, dict)
+  assert result1["nodeA"][0].dcid == "parentX"
   assert result1 == result2
   assert endpoint.fetch_place_parents.call_count == 1
 
 
+def test_fetch_relationships_batch_coalesces_missing_dcids():
+  """Test fetch_relationships_batch fetches all missing DCIDs in one call."""
+  endpoint = MagicMock()
+  endpoint.fetch_place_parents.return_value = {
+      "nodeA": [Node(dcid="parentX", name="Parent X", types=["Region"])],
+  }
+
+  cache = RelationshipCache()
+  # Prime the cache with nodeA so only nodeB is missing on the next call.
+  fetch_relationships_batch(endpoint, ["nodeA"],
+                            contained_type=None,
+                            relationship="parents",
+                            cache=cache)
+
+  endpoint.fetch_place_parents.return_value = {
+      "nodeB": [Node(dcid="parentY", name="Parent Y", types=["Region"])],
+  }
+  result = fetch_relationships_batch(endpoint, ["nodeA", "nodeB"],
+                                     contained_type=None,
+                                     relationship="parents",
+                                     cache=cache)
+
+  assert result["nodeA"][0].dcid == "parentX"
+  assert result["nodeB"][0].dcid == "parentY"
+  endpoint.fetch_place_parents.assert_called_with(
+      ["nodeB"],
+      as_dict=False,
+  )
+
+
+def test_relationship_cache_evicts_failed_fetches():
+  """Test RelationshipCache does not cache a failed fetch."""
+  cache = RelationshipCache()
+
+  def failing_fetch(dcids):
+    raise RuntimeError("boom")
+
+  with pytest.raises(RuntimeError):
+    cache.resolve(["nodeA"], failing_fetch)
+
+  # The failure is evicted, so a retry fetches again and succeeds.
+  result = cache.resolve(
+      ["nodeA"],
+      lambda dcids: {"nodeA": [Node(dcid="parentX", name="X", types=["R"])]})
+  assert result["nodeA"][0].dcid == "parentX"
+
+
 def test_build_ancestry_map_linear_tree():
   """A -> B -> C"""
 
-  def fetch_mock(dcid):
-    return {
-        "C": [Node(dcid="B", name="Node B", types=["Type"])],
-        "B": [Node(dcid="A", name="Node A", types=["Type"])],
-        "A": [],
-    }.get(dcid, [])
+  graph_data = {
+      "C": [Node(dcid="B", name="Node B", types=["Type"])],
+      "B": [Node(dcid="A", name="Node A", types=["Type"])],
+      "A": [],
+  }
+
+  def fetch_mock(dcids):
+    return {dcid: graph_data.get(dcid, []) for dcid in dcids}
 
-  root, graph = build_graph_map("C", fetch_mock, max_workers=2)
+  root, graph = build_graph_map("C", fetch_mock)
 
   assert root == "C"
   assert set(graph.keys()) == {"C", "B", "A"}
@@ -87,23 +135,23 @@ def test_build_ancestry_map_branching_graph():
         A
       """
 
-  def fetch_mock(dcid):
-    return {
-        "A": (Node(dcid="B", name="Node B",
-                   types=["Type"]), Node(dcid="C",
-                                         name="Node C",
-                                         types=["Type"])),
-        "B": (Node(dcid="D", name="Node D", types=["Type"]),),
-        "C": (Node(dcid="D", name="Node D",
-                   types=["Type"]), Node(dcid="E",
-                                         name="Node E",
-                                         types=["Type"])),
-        "D": (Node(dcid="F", name="Node F", types=["Type"]),),
-        "E": (Node(dcid="F", name="Node F", types=["Type"]),),
-        "F": tuple(),
-    }.get(dcid, tuple())
-
-  root, ancestry = build_graph_map("A", fetch_mock, max_workers=4)
+  graph_data = {
+      "A": (Node(dcid="B", name="Node B",
+                 types=["Type"]), Node(dcid="C", name="Node C",
+                                       types=["Type"])),
+      "B": (Node(dcid="D", name="Node D", types=["Type"]),),
+      "C": (Node(dcid="D", name="Node D",
+                 types=["Type"]), Node(dcid="E", name="Node E",
+                                       types=["Type"])),
+      "D": (Node(dcid="F", name="Node F", types=["Type"]),),
+      "E": (Node(dcid="F", name="Node F", types=["Type"]),),
+      "F": tuple(),
+  }
+
+  def fetch_mock(dcids):
+    return {dcid: graph_data.get(dcid, tuple()) for dcid in dcids}
+
+  root, ancestry = build_graph_map("A", fetch_mock)
 
   assert root == "A"
   assert set(ancestry.keys()) == {"A", "B", "C", "D", "E", "F"}
@@ -124,15 +172,18 @@ def test_build_ancestry_map_cycle_detection():
 
   call_count = defaultdict(int)
 
-  def fetch_mock(dcid):
-    call_count[dcid] += 1
-    return {
-        "A": (Node(dcid="B", name="B", types=["Type"]),),
-        "B": (Node(dcid="C", name="C", types=["Type"]),),
-        "C": (Node(dcid="A", name="A", types=["Type"]),),  # Cycle back to A
-    }.get(dcid, tuple())
+  graph_data = {
+      "A": (Node(dcid="B", name="B", types=["Type"]),),
+      "B": (Node(dcid="C", name="C", types=["Type"]),),
+      "C": (Node(dcid="A", name="A", types=["Type"]),),  # Cycle back to A
+  }
+
+  def fetch_mock(dcids):
+    for dcid in dcids:
+      call_count[dcid] += 1
+    return {dcid: graph_data.get(dcid, tuple()) for dcid in dcids}
 
-  root, ancestry = build_graph_map("A", fetch_mock, max_workers=2)
+  root, ancestry = build_graph_map("A", fetch_mock)
 
   assert root == "A"  # Since we start from A
   assert set(ancestry.keys()) == {"A", "B", "C"}
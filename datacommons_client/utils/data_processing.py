@@ -1,11 +1,11 @@
-from dataclasses import asdict
-import json
-from typing import Any, Dict, List
+from typing import Dict
 
 from datacommons_client.models.base import ArcLabel
+from datacommons_client.models.base import entityDCID
 from datacommons_client.models.base import facetID
 from datacommons_client.models.base import NodeDCID
 from datacommons_client.models.base import Property
+from datacommons_client.models.base import variableDCID
 from datacommons_client.models.node import Arcs
 from datacommons_client.models.node import FlattenedArcsMapping
 from datacommons_client.models.node import FlattenedPropertiesMapping
@@ -17,7 +17,6 @@ from datacommons_client.models.observation import Facet
 from datacommons_client.models.observation import ObservationRecord
 from datacommons_client.models.observation import ObservationRecords
 from datacommons_client.models.observation import OrderedFacets
-from datacommons_client.models.observation import VariableByEntity
 
 
 def unpack_arcs(arcs: Dict[ArcLabel, NodeGroup]) -> dict[Property, list[Node]]:
@@ -48,7 +47,7 @@ def flatten_properties(
             are the simplified properties or nodes.
     """
   if not data:
-    return FlattenedPropertiesMapping.model_validate({})
+    return FlattenedPropertiesMapping.model_construct(root={})
 
   first_node = next(iter(data.values()))
   is_properties = isinstance(first_node, Properties)
@@ -66,7 +65,8 @@ def flatten_properties(
       if arcs:
         items[node_id] = unpack_arcs(arcs)
 
-  return mapping_cls.model_validate(items)
+  # Items come straight out of validated response models.
+  return mapping_cls.model_construct(root=items)
 
 
 def extract_observations(
@@ -86,27 +86,102 @@ def extract_observations(
     """
   observations = []
   for facet in entity_data.orderedFacets:
+    # Resolve the shared facet fields once per facet instead of once per
+    # observation; rows within a facet only differ by date and value.
+    metadata = facet_metadata.get(facet.facetId)
+    base_record = {
+        "entity": entity,
+        "variable": variable,
+        "facetId": facet.facetId,
+        **(metadata.to_dict() if metadata is not None else {}),
+    }
+    # The inputs come straight from validated response models, so build the
+    # records with model_construct and skip re-running validation per row.
     for observation in facet.observations:
       observations.append(
-          ObservationRecord.model_validate({
-              "date": observation.date,
-              "entity": entity,
-              "variable": variable,
-              "value": observation.value,
-              "facetId": facet.facetId,
-              **facet_metadata.get(facet.facetId, Facet()).to_dict(),
-          }))
+          ObservationRecord.model_construct(date=observation.date,
+                                            value=observation.value,
+                                            **base_record))
 
   return observations
 
 
-def observations_as_records(data: VariableByEntity,
+# Column order mirrors ObservationRecord._order so tabular exports match.
+OBSERVATION_RECORD_COLUMNS: tuple[str, ...] = (
+    "date",
+    "entity",
+    "variable",
+    "facetId",
+    "importName",
+    "measurementMethod",
+    "observationPeriod",
+    "provenanceUrl",
+    "unit",
+    "value",
+)
+
+
+def observations_as_columns(data: Dict[variableDCID, Dict[entityDCID,
+                                                          OrderedFacets]],
+                            facets: dict[facetID, Facet]) -> dict[str, list]:
+  """
+    Converts observation data into columnar (struct-of-arrays) form.
+
+    Produces one list per observation record field, which is the layout
+    DataFrame constructors and plotting libraries consume directly. Unlike
+    `observations_as_records`, no per-row model is constructed, so this is
+    the fast path for tabular exports of large responses.
+
+    Args:
+        data (dict): A mapping of variables to entities and their data.
+        facets (dict): Facet metadata for the observations.
+
+    Returns:
+        dict[str, list]: A mapping of column name to column values, with one
+        entry per field in `OBSERVATION_RECORD_COLUMNS`.
+    """
+
+  columns: dict[str, list] = {name: [] for name in OBSERVATION_RECORD_COLUMNS}
+
+  dates = columns["date"]
+  entities = columns["entity"]
+  variables = columns["variable"]
+  facet_ids = columns["facetId"]
+  values = columns["value"]
+
+  metadata_columns = [(columns[name], name)
+                      for name in ("importName", "measurementMethod",
+                                   "observationPeriod", "provenanceUrl", "unit")
+                     ]
+
+  for variable, entity_map in data.items():
+    for entity, entity_data in entity_map.items():
+      for facet in entity_data.orderedFacets:
+        # Resolve the shared facet fields once per facet.
+        metadata = facets.get(facet.facetId)
+        metadata_values = [(column, getattr(metadata, name, None))
+                           for column, name in metadata_columns]
+
+        for observation in facet.observations:
+          dates.append(observation.date)
+          entities.append(entity)
+          variables.append(variable)
+          facet_ids.append(facet.facetId)
+          values.append(observation.value)
+          for column, metadata_value in metadata_values:
+            column.append(metadata_value)
+
+  return columns
+
+
+def observations_as_records(data: Dict[variableDCID, Dict[entityDCID,
+                                                          OrderedFacets]],
                             facets: dict[facetID, Facet]) -> ObservationRecords:
   """
     Converts observation data into a list of records.
 
     Args:
-        data (VariableByEntity): A mapping of variables to entities and their data.
+        data (dict): A mapping of variables to entities and their data.
         facets (dict): Facet metadata for the observations.
 
     Returns:
@@ -116,15 +191,16 @@ def observations_as_records(data: VariableByEntity,
   records = []
   for variable, entities in data.items():
     for entity, entity_data in entities.items():
-      for record in extract_observations(
-          variable=variable,
-          entity=entity,
-          entity_data=entity_data,
-          facet_metadata=facets,
-      ):
-        records.append(record)
+      records.extend(
+          extract_observations(
+              variable=variable,
+              entity=entity,
+              entity_data=entity_data,
+              facet_metadata=facets,
+          ))
 
-  return ObservationRecords.model_validate(records)
+  # The records are already validated models, so skip re-running validators.
+  return ObservationRecords.model_construct(root=records)
 
 
 def group_variables_by_entity(
@@ -147,42 +223,6 @@ def group_variables_by_entity(
   return result
 
 
-class SerializableMixin:
-  """Provides serialization methods for the Response dataclasses."""
-
-  def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-    """Converts the instance to a dictionary.
-
-        Args:
-            exclude_none: If True, only include non-empty values in the response.
-
-        Returns:
-            Dict[str, Any]: The dictionary representation of the instance.
-        """
-
-    def _remove_none(data: Any) -> Any:
-      """Recursively removes None or empty values from a dictionary or list."""
-      if isinstance(data, dict):
-        return {k: _remove_none(v) for k, v in data.items() if v is not None}
-      elif isinstance(data, list):
-        return [_remove_none(item) for item in data]
-      return data
-
-    result = asdict(self)
-    return _remove_none(result) if exclude_none else result
-
-  def to_json(self, exclude_none: bool = True) -> str:
-    """Converts the instance to a JSON string.
-
-        Args:
-            exclude_none: If True, only include non-empty values in the response.
-
-        Returns:
-            str: The JSON string representation of the instance.
-        """
-    return json.dumps(self.to_dict(exclude_none=exclude_none), indent=2)
-
-
 def flatten_names_dictionary(names_dict: dict[str, Name]) -> dict[str, str]:
   """
     Flattens a dictionary which contains Name objects into a flattened dictionary
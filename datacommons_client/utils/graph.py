@@ -1,15 +1,10 @@
-from collections import deque
-from concurrent.futures import FIRST_COMPLETED
 from concurrent.futures import Future
-from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import wait
-from functools import lru_cache
+import sys
+import threading
 from typing import Callable, Literal, Optional, TypeAlias
 
 from datacommons_client.models.node import Node
 
-GRAPH_MAX_WORKERS = 10
-
 RelationMap: TypeAlias = dict[str, list[Node]]
 AncestorsMap = RelationMap
 DescendantsMap = RelationMap
@@ -17,62 +12,136 @@ DescendantsMap = RelationMap
 # -- -- Fetch tools -- --
 
 
-def _fetch_relationship_uncached(
+class RelationshipCache:
+  """Thread-safe cache of per-DCID relationship results.
+
+    Concurrent traversals (one per root) often reach the same DCIDs. The cache
+    stores one `Future` per DCID, so a DCID whose fetch is still in flight on
+    another thread is awaited rather than re-requested — in-flight work is
+    deduplicated, not just completed results.
+    """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._futures: dict[str, Future] = {}
+
+  def resolve(
+      self,
+      dcids: list[str],
+      fetch_missing: Callable[[list[str]], RelationMap],
+  ) -> RelationMap:
+    """Returns relationships for the given DCIDs, fetching unresolved ones.
+
+        DCIDs already cached (or being fetched by another thread) are not
+        refetched; the remainder is claimed atomically and fetched in a single
+        `fetch_missing` call. A failed fetch is evicted so it can be retried.
+
+        Args:
+            dcids (list[str]): The entity IDs to resolve.
+            fetch_missing (Callable): A function that takes the missing DCIDs
+              and returns a mapping of each DCID to its Node list.
+        Returns:
+            A dictionary mapping each input DCID to a list of Node objects.
+        """
+    claimed: list[str] = []
+    with self._lock:
+      for dcid in dcids:
+        if dcid not in self._futures:
+          self._futures[dcid] = Future()
+          claimed.append(dcid)
+      futures = {dcid: self._futures[dcid] for dcid in dcids}
+
+    if claimed:
+      try:
+        fetched = fetch_missing(claimed)
+      except Exception as exc:
+        with self._lock:
+          for dcid in claimed:
+            self._futures.pop(dcid, None)
+        for dcid in claimed:
+          futures[dcid].set_exception(exc)
+        raise
+      for dcid in claimed:
+        futures[dcid].set_result(fetched.get(dcid, []))
+
+    return {dcid: futures[dcid].result() for dcid in dcids}
+
+
+def _fetch_relationships_uncached(
     endpoint,
-    dcid: str,
+    dcids: list[str],
     contained_type: str | None,
     relationship: Literal["parents", "children"],
-) -> list[Node]:
-  """Fetches the immediate parents/children of a given DCID from the endpoint, without caching.
-
-    This function performs a direct, uncached call to the API. It exists
-    primarily to serve as the internal, cache-free fetch use by functions with lru.
+) -> RelationMap:
+  """Fetches the immediate parents/children of the given DCIDs in one request.
 
-    By isolating the pure fetch logic here, we ensure that caching is handled separately
-    and cleanly via `@lru_cache`, which requires its wrapped
-    function to be deterministic and side-effect free.
+    This function performs a direct, uncached call to the API, coalescing all
+    requested DCIDs into a single `fetch_place_parents`/`fetch_place_children`
+    call so the server fans out once instead of once per node.
 
     Args:
-        endpoint: A client object with a `fetch_entity_parents` and `fetch_entity_children` method.
-        dcid (str): The entity ID for which to fetch parents.
+        endpoint: A client object with `fetch_place_parents` and `fetch_place_children` methods.
+        dcids (list[str]): The entity IDs for which to fetch relationships.
         contained_type (str): The type of the entity to be fetched.
         relationship (str): The type of relationship to fetch, either "parents" or "children".
     Returns:
-        A list of Node objects.
+        A dictionary mapping each input DCID to a list of Node objects.
     """
 
   if relationship == "parents":
-    result = endpoint.fetch_place_parents(dcid, as_dict=False).get(dcid, [])
-
+    data = endpoint.fetch_place_parents(dcids, as_dict=False)
   else:
-    result = endpoint.fetch_place_children(dcid,
-                                           children_type=contained_type,
-                                           as_dict=False).get(dcid, [])
+    data = endpoint.fetch_place_children(dcids,
+                                         children_type=contained_type,
+                                         as_dict=False)
 
-  return result if isinstance(result, list) else [result]
+  result: RelationMap = {}
+  for dcid in dcids:
+    nodes = data.get(dcid, [])
+    result[dcid] = nodes if isinstance(nodes, list) else [nodes]
 
+  return result
 
-@lru_cache(maxsize=512)
-def fetch_relationship_lru(
+
+def fetch_relationships_batch(
     endpoint,
-    dcid: str,
+    dcids: list[str],
     contained_type: str | None,
     relationship: Literal["parents", "children"],
-) -> list[Node]:
-  """Fetches parents of a DCID using an LRU cache for improved performance.
+    cache: Optional[RelationshipCache] = None,
+) -> RelationMap:
+  """Fetches parents/children for a batch of DCIDs, using a shared cache.
+
+    Only DCIDs missing from the cache are requested (in a single call), so
+    relationships shared across roots are resolved once even when the roots
+    are traversed concurrently.
+
     Args:
         endpoint: A Node client object.
-        dcid (str): The entity ID to fetch parents/children for.
+        dcids (list[str]): The entity IDs to fetch parents/children for.
         contained_type (str): The type of the entity to be fetched.
         relationship (str): The type of relationship to fetch, either "parents" or "children".
+        cache (Optional[RelationshipCache]): A shared thread-safe cache of
+          already-resolved (or in-flight) DCIDs.
     Returns:
-        A list of `Node` objects corresponding to the entity's parents or children.
+        A dictionary mapping each input DCID to a list of Node objects.
     """
-  return _fetch_relationship_uncached(
-      endpoint=endpoint,
-      dcid=dcid,
-      contained_type=contained_type,
-      relationship=relationship,
+  if cache is None:
+    return _fetch_relationships_uncached(
+        endpoint=endpoint,
+        dcids=dcids,
+        contained_type=contained_type,
+        relationship=relationship,
+    )
+
+  return cache.resolve(
+      dcids,
+      lambda missing: _fetch_relationships_uncached(
+          endpoint=endpoint,
+          dcids=missing,
+          contained_type=contained_type,
+          relationship=relationship,
+      ),
   )
 
 
@@ -81,21 +150,19 @@ def fetch_relationship_lru(
 
 def build_graph_map(
     root: str,
-    fetch_fn: Callable[..., tuple[Node, ...]],
-    *,
-    max_workers: Optional[int] = GRAPH_MAX_WORKERS,
+    fetch_fn: Callable[..., RelationMap],
 ) -> tuple[str, RelationMap]:
-  """Constructs a complete ancestry/descendancy map for the root node using parallel
-       Breadth-First Search (BFS).
+  """Constructs a complete ancestry/descendancy map for the root node using a
+       level-synchronous Breadth-First Search (BFS).
 
     Traverses the graph from the root node, discovering all parent/children
-    relationships (depending on the fetch_fn) by fetching in parallel.
+    relationships (depending on the fetch_fn). Each BFS level coalesces all
+    unseen DCIDs into a single fetch, amortizing HTTP overhead across the level.
 
     Args:
         root (str): The DCID of the root entity to start from.
-        fetch_fn (Callable): A function that takes a DCID and returns Node tuples.
-        max_workers (Optional[int]): Max number of threads to use for parallel fetching.
-          Optional, defaults to `PARENTS_MAX_WORKERS`.
+        fetch_fn (Callable): A function that takes a list of DCIDs and returns
+          a mapping of each DCID to its Node list.
 
     Returns:
         A tuple containing:
@@ -104,48 +171,35 @@ def build_graph_map(
     """
   graph_map: RelationMap = {}
   visited: set[str] = set()
-  in_progress: dict[str, Future] = {}
 
-  original_root = root
+  # DCIDs repeat heavily across relationship results; interning collapses the
+  # duplicate strings and makes the visited-set probes pointer comparisons.
+  frontier: list[str] = [sys.intern(root)]
 
-  with ThreadPoolExecutor(max_workers=max_workers) as executor:
-    queue = deque([root])
-
-    # Standard BFS loop, but fetches are executed in parallel threads
-    while queue or in_progress:
-      # Submit fetch tasks for all nodes in the queue
-      while queue:
-        dcid = queue.popleft()
-        # Check if the node has already been visited or is in progress
-        if dcid not in visited and dcid not in in_progress:
-          # Submit the fetch task
-          in_progress[dcid] = executor.submit(fetch_fn, dcid=dcid)
-
-      # Check if any futures are still in progress
-      if not in_progress:
-        continue
+  # Level-synchronous BFS: fetch the whole frontier in one request per level
+  while frontier:
+    visited.update(frontier)
+    relations = fetch_fn(dcids=frontier)
 
-      # Wait for at least one future to complete
-      done_futures, _ = wait(in_progress.values(), return_when=FIRST_COMPLETED)
+    next_frontier: list[str] = []
+    queued: set[str] = set()
 
-      # Find which DCIDs have completed
-      completed_dcids = [
-          dcid for dcid, future in in_progress.items() if future in done_futures
-      ]
+    # Distribute results and collect the next level's unseen DCIDs
+    for dcid in frontier:
+      nodes = list(relations.get(dcid, []))
+      graph_map[dcid] = nodes
 
-      # Process completed fetches and enqueue any unseen parents
-      for dcid in completed_dcids:
-        future = in_progress.pop(dcid)
-        nodes = list(future.result())
-        graph_map[dcid] = nodes
-        visited.add(dcid)
+      for node in nodes:
+        if not node or node.dcid is None:
+          continue
+        node_dcid = sys.intern(node.dcid)
+        if node_dcid not in visited and node_dcid not in queued:
+          queued.add(node_dcid)
+          next_frontier.append(node_dcid)
 
-        for node in nodes:
-          if (node and node.dcid not in visited and
-              node.dcid not in in_progress):
-            queue.append(node.dcid)
+    frontier = next_frontier
 
-  return original_root, graph_map
+  return root, graph_map
 
 
 def _postorder_nodes(root: str, graph: RelationMap) -> list[str]:
@@ -44,19 +44,22 @@ def extract_name_from_property_with_language(
 
   # Iterate through the properties to find the name in the specified language
   for candidate in properties:
-    # If no language is specified, skip the candidate
-    if "@" not in candidate.value:
+    value = candidate.value
+
+    # If no language is specified, skip the candidate. Using rfind avoids
+    # allocating a split tuple for every non-matching candidate.
+    separator_index = value.rfind("@")
+    if separator_index < 0:
       continue
 
-    # Split the candidate value into name and language
-    name, lang = candidate.value.rsplit("@", 1)
+    lang = value[separator_index + 1:]
 
-    # If the language matches, add the name to the dictionary.
+    # If the language matches, return the name (sliced only on a match).
     if lang == language:
-      return name, lang
-    # If language is 'en', store the name as a fallback
+      return value[:separator_index], lang
+    # If the language matches the fallback, store the name as a fallback
     if fallback_language and (lang == fallback_language):
-      fallback_name = name
+      fallback_name = value[:separator_index]
 
   # If no name was found in the specified language, use the fallback name (if available)
   return fallback_name, fallback_language if fallback_language else None
@@ -1,3 +1,5 @@
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
 import requests
@@ -10,6 +12,11 @@ from datacommons_client.utils.error_handling import DCConnectionError
 from datacommons_client.utils.error_handling import DCStatusError
 from datacommons_client.utils.error_handling import InvalidDCInstanceError
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
 BASE_DC_V2: str = "https://api.datacommons.org/v2"
 CUSTOM_DC_V2: str = "/core/api/v2"
 
@@ -202,27 +209,49 @@ def _fetch_with_pagination(
   if next_token:
     payload["nextToken"] = next_token
 
-  while True:
-    # Send a POST request and parse the JSON response
-    response = _send_post_request(url, payload, headers)
-
-    try:
-      page_data = response.json()
-    except ValueError:
-      raise APIError(response)
-
-    # Merge current page data into combined results
-    combined_results = _recursively_merge_dicts(combined_results, page_data)
-
-    # Update the payload with the next token
-    next_token = page_data.get("nextToken")
+  # Executor used to prefetch the next page while the current one is merged.
+  # Created lazily so single-page requests pay no threading overhead.
+  executor: Optional[ThreadPoolExecutor] = None
+  prefetched: Optional[Future] = None
 
-    # Update the payload with the next token
-    payload["nextToken"] = next_token
-
-    # Stop if the user only wants one page or if there is no next token
-    if not all_pages or not next_token:
-      break
+  try:
+    while True:
+      # Send a POST request (or collect the prefetched one) and parse the JSON
+      response = (prefetched.result() if prefetched is not None else
+                  _send_post_request(url, payload, headers))
+      prefetched = None
+
+      # Decode with orjson (C-level parse) when available; large paginated
+      # responses spend a noticeable share of their time in JSON decoding.
+      # Fall back to .json() when the raw body is not available as bytes.
+      content = getattr(response, "content", None)
+      try:
+        page_data = (orjson.loads(content) if orjson is not None and
+                     isinstance(content, (bytes, str)) else response.json())
+      except ValueError:
+        raise APIError(response)
+
+      # Update the payload with the next token
+      next_token = page_data.get("nextToken")
+      payload["nextToken"] = next_token
+
+      # Issue the next page's request before merging the current page, so the
+      # HTTP round trip overlaps with the (CPU-bound) merge work
+      if all_pages and next_token:
+        if executor is None:
+          executor = ThreadPoolExecutor(max_workers=1)
+        prefetched = executor.submit(_send_post_request, url, dict(payload),
+                                     headers)
+
+      # Merge current page data into combined results
+      combined_results = _recursively_merge_dicts(combined_results, page_data)
+
+      # Stop if the user only wants one page or if there is no next token
+      if not all_pages or not next_token:
+        break
+  finally:
+    if executor is not None:
+      executor.shutdown(wait=False)
 
   # Add the final next token to the response
   combined_results["nextToken"] = next_token